@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+cpfrx_async.py – cpfrx_file 的异步批量版：用一个 httpx.AsyncClient 并发下载多个文件并自动解压，
+多个下载共用连接池（装了 h2 时走 HTTP/2 多路复用），解压放到线程里与其余下载重叠进行。
+依赖 httpx（可选 h2），Python≥3.9 可用。
+
+用法：
+    python cpfrx_async.py <本地保存路径> <目标URL> [<目标URL> ...]
+每个目标解压到 <本地保存路径>/<序号>/ 下，序号从 1 开始。
+"""
+import asyncio
+import importlib.util
+import sys
+import tempfile
+from pathlib import Path
+
+import httpx
+
+import cpfrx_file
+from cpfrx_file import (INDEX, LINK_ATTEMPTS, SESSION, SPOOL_MAX_SIZE, accept_link,
+                        cached_csrf, store_csrf, unzip)
+
+# 与同步版共用 UA；没装 h2 时退回 HTTP/1.1
+HEADERS = {"User-Agent": SESSION.headers["User-Agent"]}
+HTTP2 = importlib.util.find_spec("h2") is not None
+MAX_CONNECTIONS = 32
+# 本模块自己的 csrf token 缓存（token 绑定 cookie，不能与同步版的 SESSION 混用）
+_CSRF_CACHE = {}
+
+
+# ---------------------------------------------------------------------------#
+async def get_csrf(client: httpx.AsyncClient, refresh: bool = False) -> str:
+    """取首页 csrf token（带缓存）"""
+    if token := cached_csrf(_CSRF_CACHE, refresh):
+        return token
+    resp = await client.get(INDEX, timeout=10)
+    resp.raise_for_status()
+    return store_csrf(_CSRF_CACHE, resp.content)
+
+
+async def get_real_url(client: httpx.AsyncClient, target: str) -> str:
+    """提交目标 URL → 提取代理直链；token 被拒时重取再试"""
+    for attempt in range(LINK_ATTEMPTS):
+        csrf = await get_csrf(client, refresh=attempt > 0)
+        resp = await client.post(
+            f"{INDEX}/servers",
+            data={"url": target, "csrf": csrf},
+            timeout=15,
+        )
+
+        if url := accept_link(_CSRF_CACHE, resp.is_success, resp.content, str(resp.url)):
+            return url
+
+    raise RuntimeError(cpfrx_file.MSG["link_failed"])
+
+
+# --------------------------------------------------------------------------- #
+async def download(client: httpx.AsyncClient, url: str, save_path: str) -> None:
+    """下载一个目标到内存（超过上限才落临时文件），再在线程里解压到 save_path"""
+    real = await get_real_url(client, url)
+    save_dir = Path(save_path)
+    save_dir.mkdir(parents=True, exist_ok=True)
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as tmp:
+        # 二进制下载不要压缩：ZIP 本身已压缩，再压只浪费 CPU
+        async with client.stream("GET", real,
+                                 headers={"Accept-Encoding": "identity"}) as r:
+            r.raise_for_status()
+            print(cpfrx_file.MSG["final_link"], r.url)
+            async for chunk in r.aiter_bytes(1024 * 1024):
+                tmp.write(chunk)
+        print(cpfrx_file.MSG["downloaded_url"], url)
+
+        tmp.seek(0)
+        # 解压是阻塞的，放到线程里，事件循环继续驱动其余下载
+        await asyncio.to_thread(unzip, tmp, save_dir)
+
+
+async def main_async(targets: list, save_path: str) -> int:
+    """并发下载全部目标，返回失败个数"""
+    limits = httpx.Limits(max_connections=MAX_CONNECTIONS)
+    save_root = Path(save_path).resolve()
+    async with httpx.AsyncClient(http2=HTTP2, limits=limits, headers=HEADERS,
+                                 follow_redirects=True, timeout=30) as client:
+        # 先取好 token，避免各任务同时去首页取
+        await get_csrf(client)
+        # 同时进行的目标不超过连接数：HTTP/1.1 下每个下载全程占一个连接，
+        # 多出来的任务在池里等连接会撞上超时；也让内存里最多只有这么多个缓冲
+        slots = asyncio.Semaphore(MAX_CONNECTIONS)
+
+        async def limited(target: str, save_dir: str) -> None:
+            async with slots:
+                await download(client, target, save_dir)
+
+        results = await asyncio.gather(
+            *(limited(t, str(save_root / str(i)))
+              for i, t in enumerate(targets, 1)),
+            return_exceptions=True,
+        )
+    failed = 0
+    for target, result in zip(targets, results):
+        if isinstance(result, Exception):
+            failed += 1
+            # 有的异常（如 httpx.PoolTimeout）str 为空，退回 repr
+            print(cpfrx_file.MSG["failed"], target, str(result) or repr(result))
+    return failed
+
+
+# --------------------------------------------------------------------------- #
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print(cpfrx_file.MSG["usage_async"])
+        sys.exit(1)
+    local, targets = sys.argv[1], sys.argv[2:]
+    try:
+        sys.exit(2 if asyncio.run(main_async(targets, local)) else 0)
+    except Exception as e:
+        print(cpfrx_file.MSG["failed"], e)
+        sys.exit(2)
@@ -1,28 +1,70 @@
 #!/usr/bin/env python3
 """
 cpfrx_downloader.py – 通过 CroxyProxy 简写域名（cpfrx）下载任意文件并自动解压。
-仅依赖 requests + bs4 + zipfile，Python≥3.7 可用。
+仅依赖 requests + zipfile，Python≥3.8 可用。
+提示语按环境变量 LANG 选择：en* 为英文，其余为中文；cpfrx_file_en.py 固定英文。
 
 用法：
-    python cpfrx_downloader.py <目标URL> <本地保存路径>
+    python cpfrx_downloader.py <目标URL> [<目标URL> ...] <本地保存路径>
+给出多个目标时依次下载，每个解压到 <本地保存路径>/<序号>/ 下（序号从 1 开始），
+解压在后台线程进行，与下一个目标的下载重叠。
 示例：
     python cpfrx_downloader.py \
         https://mirror.nyist.edu.cn/ubuntu-releases/24.04/ubuntu-24.04-desktop-amd64.iso \
         downloads/
 """
+import contextlib
+import io
+import os
+import queue
 import re
+import shutil
+import socket
 import sys
-import zipfile  # 导入zipfile模块
-from pathlib import Path
-from urllib.parse import urljoin
+import tempfile
+import threading
+import time
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from pathlib import Path, PurePosixPath
 
 import requests
-from bs4 import BeautifulSoup
 from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+
+
+class _TunedAdapter(HTTPAdapter):
+    """RCVBUF_SIZE 非 0 时，在 urllib3 默认套接字选项（TCP_NODELAY）基础上固定 TCP 接收缓冲区"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        if RCVBUF_SIZE:
+            kwargs["socket_options"] = HTTPConnection.default_socket_options + [
+                (socket.SOL_SOCKET, socket.SO_RCVBUF, RCVBUF_SIZE),
+            ]
+        super().init_poolmanager(*args, **kwargs)
+
 
 INDEX = "https://www.a.cpfrx.info"
+# 下载缓冲在内存中的上限，超过后自动转存到临时文件
+SPOOL_MAX_SIZE = 256 * 1024 * 1024
+# 进度刷新间隔（秒），约 10 Hz
+PROGRESS_INTERVAL = 0.1
+# 分段并发下载的连接数，以及启用分段的最小文件大小
+RANGE_WORKERS = 8
+RANGE_MIN_SIZE = 8 * 1024 * 1024
+# TCP 接收缓冲区大小，默认 0 即不设置。Linux 上设置 SO_RCVBUF 会关闭接收窗口自动调节，
+# 且实际值受 net.core.rmem_max 限制（默认内核约 208 KiB），反而比自动调节的上限
+# （tcp_rmem，常见 6 MiB）小；只有调大过 rmem_max 的机器才值得设置
+RCVBUF_SIZE = 0
 SESSION = requests.Session()
-SESSION.mount("https://", HTTPAdapter(max_retries=3))
+# 连接池按并发下载放大；502/503/504 退避重试
+_ADAPTER = _TunedAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+)
+SESSION.mount("https://", _ADAPTER)
+SESSION.mount("http://", _ADAPTER)
 SESSION.headers.update(
     {
         "User-Agent": ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -30,92 +72,478 @@ SESSION.headers.update(
                        "Chrome/124.0.0.0 Safari/537.36")
     }
 )
+# 首页 <input name="csrf" value="..."> ，两种属性顺序都兼容
+_CSRF_RE = re.compile(
+    rb'<input[^>]*name="csrf"[^>]*value="([^"]+)"'
+    rb'|<input[^>]*value="([^"]+)"[^>]*name="csrf"'
+)
+# 206 响应的 Content-Range: bytes 起-止/总长（总长为 * 时不匹配）
+_CONTENT_RANGE_RE = re.compile(r"bytes (\d+)-(\d+)/(\d+)")
+# csrf token 缓存，600 秒内复用，被拒时作废重取；cpfrx_async 另有一份，共用下面的读写函数
+_CSRF_CACHE = {}
+_CSRF_TTL = 600
+# 提交 /servers 的次数：第一次用缓存的 token，之后每次都重取
+LINK_ATTEMPTS = 2
+# /servers 返回页里的三种直链写法，合成一个正则一次扫描。
+# <a ...href=...> 一支用前瞻只消耗 "<a"，同一标签里的 data-u 仍会被扫描到
+_LINK_RE = re.compile(
+    rb'data-u="(?P<du>[^"]*)"'
+    rb'|window\.location\.href\s*=\s*"(?P<wl>[^"]*)"'
+    rb'|<a(?=[^>]*href="(?P<ah>/(?:stream|get|browser)/[^"]*)")'
+)
+
+
+# 提示语表，按 LANG 取一套；cpfrx_file_en.py 会把 MSG 换成英文
+MSGS = {
+    "zh": {
+        "csrf_failed": "无法获取 csrf token，可能页面结构变化",
+        "link_failed": "无法提取直链，可能页面结构变化",
+        "range_ignored": "服务器未按 Range 返回分段",
+        "range_incomplete": "分段 {lo}-{hi} 下载不完整",
+        "unsafe_path": "压缩包内路径不安全：{path}",
+        "final_link": "最终直链：",
+        "downloaded": "\n下载完成",
+        "downloaded_url": "下载完成：",
+        "unzipped": "\n解压完成 → {save_dir}",
+        "usage": "用法: python cpfrx_downloader.py <目标URL> [<目标URL> ...] <本地保存路径>",
+        "usage_async": "用法: python cpfrx_async.py <本地保存路径> <目标URL> [<目标URL> ...]",
+        "failed": "失败：",
+    },
+    "en": {
+        "csrf_failed": "Failed to retrieve CSRF token, possible page structure change",
+        "link_failed": "Failed to extract direct link, possible page structure change",
+        "range_ignored": "Server ignored the Range request",
+        "range_incomplete": "Range {lo}-{hi} incomplete",
+        "unsafe_path": "Unsafe path in archive: {path}",
+        "final_link": "Final direct link:",
+        "downloaded": "\nDownload completed",
+        "downloaded_url": "Download completed:",
+        "unzipped": "\nUnzipped → {save_dir}",
+        "usage": "Usage: python cpfrx_downloader.py <Target URL> [<Target URL> ...] <Local save path>",
+        "usage_async": "Usage: python cpfrx_async.py <Local save path> <Target URL> [<Target URL> ...]",
+        "failed": "Failed:",
+    },
+}
+MSG = MSGS["en" if os.environ.get("LANG", "").startswith("en") else "zh"]
 
 
 # ---------------------------------------------------------------------------#
-def get_csrf() -> str:
-    """取首页 csrf token token"""
+# 以下几个函数只处理缓存和页面解析，不发请求，同步版和 cpfrx_async 共用
+def cached_csrf(cache: dict, refresh: bool = False):
+    """cache 里未过期的 csrf token；refresh 为真或已过期时返回 None"""
+    if (not refresh and cache.get("token")
+            and time.monotonic() - cache["ts"] < _CSRF_TTL):
+        return cache["token"]
+    return None
+
+
+def store_csrf(cache: dict, html: bytes) -> str:
+    """从首页 html 提取 csrf token，存入 cache 并返回"""
+    m = _CSRF_RE.search(html)
+    if not m:
+        raise RuntimeError(MSG["csrf_failed"])
+    cache["token"] = (m.group(1) or m.group(2)).decode()
+    cache["ts"] = time.monotonic()
+    return cache["token"]
+
+
+def accept_link(cache: dict, ok: bool, html: bytes, base_url: str):
+    """检查 /servers 的返回：成功返回直链；被拒（非 2xx 或提取不到直链）时作废 cache 里的 token，返回 None"""
+    if ok and (url := extract_link(html, base_url)):
+        return url
+    cache.clear()
+    return None
+
+
+def extract_link(html: bytes, base_url: str):
+    """从 /servers 返回页 html 提取直链（相对链接按 base_url 补全），找不到返回 None
+
+    >>> extract_link(b'<a data-u="https://x/du" href="/stream/ah">', "https://b/")
+    'https://x/du'
+    >>> extract_link(b'<a href="/stream/ah">', "https://b/")
+    'https://b/stream/ah'
+    """
+    from urllib.parse import urljoin
+
+    # 直接在原始字节上扫描一次（不解码整页），按优先级取：
+    # data-u > window.location.href > /stream/ 等链接
+    found = {}
+    for m in _LINK_RE.finditer(html):
+        if m.lastgroup == "du":  # data-u 字段（最常见），直接返回
+            du = m.group("du").replace(rb"\/", b"/").replace(b"&quot;", b"").strip(b'"')
+            return du.decode()
+        found.setdefault(m.lastgroup, m.group(m.lastgroup))
+
+    if "wl" in found:
+        return urljoin(base_url, found["wl"].replace(rb"\/", b"/").decode())
+    if "ah" in found:
+        return urljoin(base_url, found["ah"].decode())
+    return None
+
+
+def get_csrf(refresh: bool = False) -> str:
+    """取首页 csrf token（带缓存）"""
+    if token := cached_csrf(_CSRF_CACHE, refresh):
+        return token
     resp = SESSION.get(INDEX, timeout=10)
     resp.raise_for_status()
-    soup = BeautifulSoup(resp.text, "html.parser")
-    return soup.find("input", {"name": "csrf"})["value"]
+    return store_csrf(_CSRF_CACHE, resp.content)
 
 
 def get_real_url(target: str) -> str:
     """提交目标 URL → 提取代理直链（万能正则）"""
-    csrf = get_csrf()
-    resp = SESSION.post(
-        f"{INDEX}/servers",
-        data={"url": target, "csrf": csrf},
-        allow_redirects=False,
-        timeout=15,
-    )
-    if resp.status_code in (301, 302):
-        resp = SESSION.send(resp.next, allow_redirects=True)
-
-    html = resp.text
-
-    # 1. data-u 字段（最常见）
-    if m := re.search(r'data-u="([^"]*)"', html):
-        url = m.group(1).replace(r"\/", "/").replace("&quot;", "").strip('"')
-        return url
-
-    # 2. window.location.href = "..."
-    if m := re.search(r'window\.location\.href\s*=\s*"([^"]*)"', html):
-        return urljoin(resp.url, m.group(1).replace(r"\/", "/"))
+    # 第一次用缓存的 token；被拒则重取 token 再试
+    for attempt in range(LINK_ATTEMPTS):
+        csrf = get_csrf(refresh=attempt > 0)
+        resp = SESSION.post(
+            f"{INDEX}/servers",
+            data={"url": target, "csrf": csrf},
+            allow_redirects=True,
+            timeout=15,
+        )
 
-    # 3. 任何 /stream/ /get/ /browser/ 链接
-    if m := re.search(r'<a[^>]*href="(/(?:stream|get|browser)/[^"]*)"', html):
-        return urljoin(resp.url, m.group(1))
+        if url := accept_link(_CSRF_CACHE, resp.ok, resp.content, resp.url):
+            return url
 
-    raise RuntimeError("无法提取直链，可能页面结构变化")
+    raise RuntimeError(MSG["link_failed"])
 
 
 # --------------------------------------------------------------------------- #
-def download(url: str, save_path: str) -> None:
-    """分块下载 + 进度条"""
-    real = get_real_url(url)
-    # 再加一次跳转，确保拿到最终 /stream/xxx
-    r0 = SESSION.head(real, allow_redirects=True)
-    real = r0.url
-    print("最终直链：", real)
+def _progress_loop(done, total: int, stop: threading.Event) -> None:
+    """进度线程：每 PROGRESS_INTERVAL 秒用 done() 取已写入字节数刷新一次，stop 后输出最终值"""
+    total_fmt = f"{total:,}"  # 总长只格式化一次
+    write, flush = sys.stdout.write, sys.stdout.flush
+    while True:
+        stopped = stop.wait(PROGRESS_INTERVAL)
+        n = done()
+        write(f"\r{n:,}/{total_fmt}  {n * 100 // total}%")
+        flush()
+        if stopped:
+            return
+
+
+@contextlib.contextmanager
+def _progress(done, total: int):
+    """with 块内后台刷新进度，退出时停止并输出最终值；总长未知时不显示"""
+    if not total:
+        yield
+        return
+    stop = threading.Event()
+    t = threading.Thread(target=_progress_loop, args=(done, total, stop), daemon=True)
+    t.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        t.join()
+
+
+def _prepare_buffer(f, total: int) -> bool:
+    """大小已知且超过内存上限时直接转存磁盘：预分配空间并提示顺序读写，返回是否已落盘"""
+    if total <= SPOOL_MAX_SIZE:
+        return False
+    f.rollover()
+    fd = f.fileno()
+    if hasattr(os, "posix_fallocate"):  # Windows 下没有，跳过
+        try:
+            os.posix_fallocate(fd, 0, total)
+        except OSError:  # 文件系统不支持时忽略
+            pass
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    return True
+
+
+def _download_stream(r: requests.Response, f, total: int) -> None:
+    """单连接顺序把响应体写入 f"""
+    # 热循环交给 shutil.copyfileobj 直接读 urllib3 原始流，
+    # 绕开 iter_content 每块的 Python 开销；进度改由后台线程轮询 f.tell()
+    with _progress(f.tell, total):
+        r.raw.decode_content = True
+        shutil.copyfileobj(r.raw, f, length=1024 * 1024)
+    # 预分配过的文件按实际写入长度截断
+    f.truncate()
+
+
+def _copy_range(r: requests.Response, lo: int, hi: int, f, lock: threading.Lock,
+                streams: list, idx: int, abort: threading.Event) -> None:
+    """把响应体的前 hi-lo+1 字节写到 f 的 [lo, hi] 偏移处"""
+    # 登记原始流，进度线程按需用 tell() 统计已读字节，热循环里不再记账
+    streams[idx] = r.raw
+    read = r.raw.read
+    pos = lo
+    while pos <= hi and not abort.is_set():
+        # 按剩余长度精确读取，第一段不会读过界
+        chunk = read(min(1024 * 1024, hi + 1 - pos))
+        if not chunk:
+            break
+        with lock:
+            f.seek(pos)
+            f.write(chunk)
+        pos += len(chunk)
+    if pos != hi + 1 and not abort.is_set():
+        raise RuntimeError(MSG["range_incomplete"].format(lo=lo, hi=hi))
+
+
+def _fetch_range(url: str, total: int, lo: int, hi: int, *args) -> None:
+    """工作线程：单独请求 [lo, hi] 字节段并写入 f"""
+    headers = {"Range": f"bytes={lo}-{hi}", "Accept-Encoding": "identity"}
+    with SESSION.get(url, stream=True, headers=headers, timeout=30) as r:
+        r.raise_for_status()
+        # 只认正好是所请求分段的 206，否则写到 lo 处的数据会错位
+        if r.status_code != 206 or _content_range(r) != (lo, hi, total):
+            raise RuntimeError(MSG["range_ignored"])
+        _copy_range(r, lo, hi, *args)
+
+
+def _download_ranged(r: requests.Response, f, total: int) -> None:
+    """按 Range 切成 RANGE_WORKERS 段并发下载到 f；第一段直接沿用已打开的响应 r"""
+    step = -(-total // RANGE_WORKERS)
+    bounds = [(lo, min(lo + step, total) - 1) for lo in range(0, total, step)]
+    streams = [None] * len(bounds)
+    lock = threading.Lock()
+    abort = threading.Event()
+    shared = (f, lock, streams)
+    with ThreadPoolExecutor(max_workers=len(bounds)) as pool:
+        lo, hi = bounds[0]
+        pending = {pool.submit(_copy_range, r, lo, hi, *shared, 0, abort)}
+        pending.update(
+            pool.submit(_fetch_range, r.url, total, lo, hi, *shared, i, abort)
+            for i, (lo, hi) in enumerate(bounds) if i
+        )
+        try:
+            with _progress(lambda: sum(s.tell() for s in streams if s), total):
+                finished, _ = wait(pending, return_when=FIRST_EXCEPTION)
+            for fut in finished:
+                fut.result()  # 任一段失败立即抛出
+        finally:
+            abort.set()
+
+
+def _content_range(r: requests.Response):
+    """解析 206 的 Content-Range: bytes 起-止/总长，返回 (起, 止, 总长)，无法解析返回 None"""
+    m = _CONTENT_RANGE_RE.fullmatch(r.headers.get("content-range", "").strip())
+    return tuple(map(int, m.groups())) if m else None
+
 
-    with SESSION.get(real, stream=True) as r:
+def _open(real: str):
+    """GET 直链（跟随跳转），返回 (响应, 总大小, 是否支持分段)，总大小未知为 0。
+    先带 Range: bytes=0- 顺便探测分段支持（不支持的服务器照常回 200）；
+    206 但没覆盖整个文件（有的服务器会截断开放区间）时改发不带 Range 的普通 GET"""
+    # 二进制下载不要压缩：ZIP 本身已压缩，再压只浪费 CPU
+    headers = {"Accept-Encoding": "identity"}
+    r = SESSION.get(real, stream=True, headers={**headers, "Range": "bytes=0-"})
+    if r.status_code == 206:
+        cr = _content_range(r)
+        if cr and cr[0] == 0 and cr[1] == cr[2] - 1:
+            return r, cr[2], True
+        r.close()
+        r = SESSION.get(r.url, stream=True, headers=headers)
+    if not r.ok:
+        r.close()
         r.raise_for_status()
-        total = int(r.headers.get("content-length", 0))
-        done = 0
-        save_dir = Path(save_path)
-        save_dir.mkdir(parents=True, exist_ok=True)
-        with open(save_dir / "downloaded_file.zip", "wb") as f:
-            for chunk in r.iter_content(chunk_size=1024 * 64):
-                if not chunk:
-                    continue
-                f.write(chunk)
-                done += len(chunk)
-                if total:
-                    percent = done * 100 // total
-                    print(f"\r{done:,}/{total:,}  {percent}%", end="", flush=True)
-        print(f"\n完成 → {save_dir}")
-
-
-def unzip(save_dir: str) -> None:
-    """解压文件"""
-    save_dir_path = Path(save_dir)
-    downloaded_file = save_dir_path / "downloaded_file.zip"
-    with zipfile.ZipFile(downloaded_file, 'r') as zip_ref:
-        zip_ref.extractall(save_dir_path)
-    print(f"\n解压完成 → {save_dir}")
+    return r, int(r.headers.get("content-length", 0)), False
+
+
+def _fetch(url: str):
+    """下载一个目标到 SpooledTemporaryFile（超过上限才落临时文件）+ 进度条，
+    返回 (已 seek(0) 的缓冲, 是否已落盘)"""
+    real = get_real_url(url)
+
+    tmp = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+    try:
+        # 不再单独 HEAD：GET 自己跟随跳转到最终 /stream/xxx
+        r, total, ranged = _open(real)
+        with r:
+            print(MSG["final_link"], r.url)
+            on_disk = _prepare_buffer(tmp, total)
+            # 服务器支持 Range 且文件够大时多连接分段下载，否则单连接
+            if ranged and total >= RANGE_MIN_SIZE:
+                _download_ranged(r, tmp, total)
+            else:
+                _download_stream(r, tmp, total)
+        print(MSG["downloaded"])
+    except BaseException:
+        tmp.close()
+        raise
+    tmp.seek(0)
+    return tmp, on_disk
+
+
+def _unzip_buffer(tmp, on_disk: bool, save_dir: Path) -> None:
+    """解压 _fetch 得到的缓冲并关闭它"""
+    with tmp:
+        unzip(tmp, save_dir)
+        if on_disk and hasattr(os, "posix_fadvise"):
+            # 解压完就不再需要，释放其占用的页缓存
+            os.posix_fadvise(tmp.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+def download(url: str, save_path: str) -> None:
+    """分块下载到内存（超过上限才落临时文件）+ 进度条，随后直接解压"""
+    save_dir = Path(save_path).resolve()
+    save_dir.mkdir(parents=True, exist_ok=True)
+    _unzip_buffer(*_fetch(url), save_dir)
+
+
+def download_many(targets: list, save_path: str) -> int:
+    """依次下载多个目标，各解压到 save_path/<序号>/，返回失败个数。
+    解压交给后台线程，与下一个目标的下载重叠进行"""
+    # 启动解压线程之前就解析成绝对路径：后台解压进行时，两个线程用到的
+    # 路径都不依赖当前工作目录（解压本身也从不切换工作目录）
+    save_root = Path(save_path).resolve()
+    # 至多一个已下载的缓冲在排队，内存占用不随目标数增长
+    jobs = queue.Queue(maxsize=1)
+    failed = []
+
+    def extractor() -> None:
+        while (job := jobs.get()) is not None:
+            target, *args = job
+            try:
+                _unzip_buffer(*args)
+            except Exception as e:
+                failed.append(target)
+                print(MSG["failed"], target, e)
+
+    t = threading.Thread(target=extractor, daemon=True)
+    t.start()
+    try:
+        for i, target in enumerate(targets, 1):
+            save_dir = save_root / str(i)
+            try:
+                save_dir.mkdir(parents=True, exist_ok=True)
+                tmp, on_disk = _fetch(target)
+            except Exception as e:
+                failed.append(target)
+                print(MSG["failed"], target, e)
+                continue
+            jobs.put((target, tmp, on_disk, save_dir))
+    finally:
+        jobs.put(None)
+        t.join()
+    return len(failed)
+
+
+def _rebase_entries(entries, save_dir_path: Path):
+    """把每个条目的路径（硬链接的目标也一样）改写为 save_dir_path 下的绝对路径，
+    不必切换进程级的工作目录；绝对路径和含 .. 的条目直接拒绝"""
+    for entry in entries:
+        names = ["pathname", "linkpath"] if entry.islnk else ["pathname"]
+        for name in names:
+            path = PurePosixPath(getattr(entry, name))
+            if path.is_absolute() or ".." in path.parts:
+                raise RuntimeError(MSG["unsafe_path"].format(path=path))
+            setattr(entry, name, str(save_dir_path.joinpath(path)))
+        yield entry
+
+
+def _unzip_libarchive(archive, save_dir_path: Path) -> bool:
+    """用 libarchive 在 C 层流式解压，禁止 .. / 绝对路径 / 穿越符号链接；不可用返回 False"""
+    try:  # 可选依赖 libarchive-c，用到时才导入
+        import libarchive
+        import libarchive.extract
+    except (ImportError, OSError, AttributeError):  # 没装，或找不到系统 libarchive 库
+        return False
+    # 路径已由 _rebase_entries 检查并改成绝对路径，这里只需再禁止穿越符号链接
+    flags = libarchive.extract.EXTRACT_SECURE_SYMLINKS
+    with libarchive.stream_reader(archive, block_size=1024 * 1024) as entries:
+        libarchive.extract.extract_entries(_rebase_entries(entries, save_dir_path), flags)
+    return True
+
+
+class _SharedReader(io.RawIOBase):
+    """同一个已打开文件的只读视图：自带读位置，读时加锁定位再读。
+    每个解压线程各包一个、各开一个 ZipFile，不共用 ZipFile 内部未加锁的状态"""
+
+    def __init__(self, f, lock: threading.Lock, size: int):
+        self._f, self._lock, self._size = f, lock, size
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        base = {os.SEEK_SET: 0, os.SEEK_CUR: self._pos, os.SEEK_END: self._size}[whence]
+        self._pos = base + offset
+        return self._pos
+
+    def readinto(self, b) -> int:
+        with self._lock:
+            self._f.seek(self._pos)
+            n = self._f.readinto(b)
+        self._pos += n
+        return n
+
+
+def _unzip_threads(archive, save_dir_path: Path) -> None:
+    """用 zipfile 多线程解压（zlib 解压时释放 GIL），每个线程各用一个 ZipFile"""
+    import zipfile
+
+    lock = threading.Lock()
+    size = archive.seek(0, os.SEEK_END)
+
+    def open_zip():
+        reader = _SharedReader(archive, lock, size)
+        return zipfile.ZipFile(io.BufferedReader(reader, 1024 * 1024))
+
+    with open_zip() as zip_ref:
+        infos = zip_ref.infolist()
+        members = [i for i in infos if not i.is_dir()]
+        # 主线程先建好目录树，避免工作线程里 os.makedirs 互相竞争
+        dirs = {i.filename for i in infos if i.is_dir()}
+        dirs.update(m.filename.rsplit("/", 1)[0] + "/"
+                    for m in members if "/" in m.filename)
+        for d in sorted(dirs):
+            zip_ref.extract(zipfile.ZipInfo(d), save_dir_path)
+
+    # 按大小降序轮流分片，尽量让各线程负载均衡
+    workers = max(1, min(os.cpu_count() or 1, len(members)))
+    members.sort(key=lambda i: i.file_size, reverse=True)
+    shards = [members[i::workers] for i in range(workers)]
+
+    def extract_shard(shard: list) -> None:
+        with open_zip() as own:
+            for info in shard:
+                own.extract(info, save_dir_path)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(extract_shard, shards))
+
+
+def unzip(archive, save_dir: str) -> None:
+    """解压 archive（已打开的二进制文件对象），有 libarchive 用 libarchive，否则 zipfile 多线程"""
+    # 解析成不含符号链接的绝对路径，libarchive 检查符号链接时才不会误判
+    save_dir_path = Path(save_dir).resolve()
+    if isinstance(archive, tempfile.SpooledTemporaryFile):
+        # Python 3.11 之前它没有 seekable/readinto，zipfile 和 libarchive 都读不了，
+        # 改用其底层的 BytesIO 或临时文件
+        archive = archive._file
+    if not _unzip_libarchive(archive, save_dir_path):
+        _unzip_threads(archive, save_dir_path)
+    print(MSG["unzipped"].format(save_dir=save_dir))
 
 
 # --------------------------------------------------------------------------- #
-if __name__ == "__main__":
-    if len(sys.argv) != 3:
-        print("用法: python cpfrx_downloader.py <目标URL> <本地保存路径>")
+def main() -> None:
+    if len(sys.argv) < 3:
+        print(MSG["usage"])
         sys.exit(1)
-    target, local = sys.argv[1], sys.argv[2]
+    *targets, local = sys.argv[1:]
     try:
-        download(target, local)
-        unzip(local)
+        if len(targets) == 1:
+            download(targets[0], local)
+        elif download_many(targets, local):
+            sys.exit(2)
     except Exception as e:
-        print("失败：", e)
-        sys.exit(2)
\ No newline at end of file
+        print(MSG["failed"], e)
+        sys.exit(2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,19 @@
-import requests, sys
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
+import sys
 
-INDEX = "https://www.a.cpfrx.info"
-s = requests.Session()
+from cpfrx_file import INDEX, SESSION, get_csrf
 
-# 1. 拿 csrf
-r = s.get(INDEX)
-csrf = BeautifulSoup(r.text, "html.parser").find("input", {"name": "csrf"})["value"]
+# 1. 拿 csrf（与下载器共用会话和正则）
+csrf = get_csrf()
 print("csrf =", csrf)
 
 # 2. 请求目标
 target = sys.argv[1] if len(sys.argv) > 1 else \
          "https://releases.ubuntu.com/24.04/ubuntu-24.04-desktop-amd64.iso"
 print("target =", target)
-resp = s.post(f"{INDEX}/servers",
-              data={"url": target, "csrf": csrf},
-              allow_redirects=True)
-html = resp.text
+resp = SESSION.post(f"{INDEX}/servers",
+                    data={"url": target, "csrf": csrf},
+                    allow_redirects=True)
+# 只解码要打印的那一段
+html = resp.content[:20_000].decode(resp.encoding or "utf-8", "replace")
 print("\n==== 返回前 20 kB ====")
-print(html[:20_000])
\ No newline at end of file
+print(html)